@@ -1,12 +1,102 @@
+import ast
 import math
+import functools
+import types
+
 import numpy as np
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox
 
 from matplotlib.figure import Figure
+from matplotlib.legend import Legend
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+try:
+    import numexpr as ne
+except ImportError:  # optional speedup for equation mode
+    ne = None
+
+try:
+    from numba import njit
+except ImportError:  # optional speedup for line fits on large tables
+    njit = None
+
+
+# Constants are folded into the compiled expression as literals
+_CONSTANTS = {"pi": math.pi, "e": math.e}
+
+# Restricted namespace for expressions; "x" is the only free variable.
+_ALLOWED_NS = {
+    # Elementary
+    "sin": np.sin, "cos": np.cos, "tan": np.tan,
+    "asin": np.arcsin, "acos": np.arccos, "atan": np.arctan,
+    "sinh": np.sinh, "cosh": np.cosh, "tanh": np.tanh,
+    "exp": np.exp, "log": np.log, "log10": np.log10,
+    "sqrt": np.sqrt, "abs": np.abs,
+    "floor": np.floor, "ceil": np.ceil,
+    "pow": np.power, "arctan2": np.arctan2,
+    # Optional numpy exposure (limited)
+    "np": np,
+}
+
+# Names numexpr evaluates with the same meaning as in _ALLOWED_NS
+_NUMEXPR_NAMES = frozenset({
+    "sin", "cos", "tan", "sinh", "cosh", "tanh",
+    "exp", "log", "log10", "sqrt", "abs", "arctan2",
+})
+
+# Below this many points numexpr's call overhead outweighs the fused loop
+_NUMEXPR_MIN_SIZE = 100_000
+
+
+_ALLOWED_NAMES = frozenset(_ALLOWED_NS) | frozenset(_CONSTANTS) | {"x"}
+
+
+class _FoldConstants(ast.NodeTransformer):
+    def visit_Name(self, node):
+        if isinstance(node.ctx, ast.Load) and node.id in _CONSTANTS:
+            return ast.copy_location(ast.Constant(value=_CONSTANTS[node.id]), node)
+        return node
+
+
+@functools.lru_cache(maxsize=128)
+def _validated_code(expr: str) -> types.CodeType:
+    """
+    Parse the expression, reject names outside the namespace, fold pi/e into
+    literals, and compile it once as the body of `lambda x: ...`.
+    The caret is normalized to Python power.
+    """
+    tree = ast.parse(expr.replace("^", "**"), filename="<graph-expr>", mode="eval")
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and node.id not in _ALLOWED_NAMES:
+            raise ValueError(f"Unknown name '{node.id}'")
+        if isinstance(node, ast.Attribute) and node.attr.startswith("_"):
+            raise ValueError(f"Access to '{node.attr}' is not allowed")
+
+    args = ast.arguments(posonlyargs=[], args=[ast.arg(arg="x")], kwonlyargs=[], kw_defaults=[], defaults=[])
+    body = _FoldConstants().visit(tree).body
+    fn_tree = ast.Expression(body=ast.Lambda(args=args, body=body))
+    ast.fix_missing_locations(fn_tree)
+    return compile(fn_tree, "<graph-expr>", "eval")
+
+
+@functools.lru_cache(maxsize=64)
+def _expr_fn(expr: str):
+    """
+    Build (once per expression) a function x -> y over the restricted namespace.
+    Names resolve as globals of the lambda, so no namespace dict is rebuilt per call.
+    """
+    return eval(_validated_code(expr), {"__builtins__": {}, **_ALLOWED_NS})
+
+
+@functools.lru_cache(maxsize=128)
+def _numexpr_ok(expr: str) -> bool:
+    """
+    True when numexpr is installed and the expression only uses names it supports.
+    """
+    return ne is not None and set(_expr_fn(expr).__code__.co_names) <= _NUMEXPR_NAMES
+
 
 def safe_eval_expression(expr: str, x_array: np.ndarray) -> np.ndarray:
     """
@@ -14,68 +104,114 @@ def safe_eval_expression(expr: str, x_array: np.ndarray) -> np.ndarray:
     Supported: +, -, *, /, **, parentheses, and common NumPy functions.
     Users can write e.g.: sin(x) + 0.5*x**2 or exp(-x)*sin(2*x)
     """
-    # Normalize caret to Python power
-    expr = expr.replace("^", "**")
-
-    allowed = {
-        # Variables
-        "x": x_array,
-
-        # Constants
-        "pi": np.pi, "e": np.e,
-
-        # Elementary
-        "sin": np.sin, "cos": np.cos, "tan": np.tan,
-        "asin": np.arcsin, "acos": np.arccos, "atan": np.arctan,
-        "sinh": np.sinh, "cosh": np.cosh, "tanh": np.tanh,
-        "exp": np.exp, "log": np.log, "log10": np.log10,
-        "sqrt": np.sqrt, "abs": np.abs,
-        "floor": np.floor, "ceil": np.ceil,
-        "pow": np.power, "arctan2": np.arctan2,
-        # Optional numpy exposure (limited)
-        "np": np,
-    }
     try:
-        y = eval(expr, {"__builtins__": {}}, allowed)
-        y = np.asarray(y, dtype=float)
+        if x_array.size >= _NUMEXPR_MIN_SIZE and _numexpr_ok(expr):
+            try:
+                local_dict = {"x": x_array, **_CONSTANTS}
+                return np.asarray(ne.evaluate(expr.replace("^", "**"), local_dict=local_dict), dtype=float)
+            except Exception:
+                pass  # Fall back to the NumPy path below
+        y = np.asarray(_expr_fn(expr)(x_array), dtype=float)
     except Exception as ex:
         raise ValueError(f"Invalid expression: {ex}")
     return y
 
 
+# Below this many points NumPy is fast enough that the Numba kernel is not worth its JIT cost
+_NUMBA_MIN_SIZE = 10_000
+
+
+def _line_stats_np(x: np.ndarray, y: np.ndarray):
+    """
+    Means and least squares slope of the points, from one set of reductions.
+    Returns (xm, ym, m); m is nan when x has no spread.
+    """
+    xm = x.mean()
+    ym = y.mean()
+    dx = x - xm
+    with np.errstate(divide="ignore", invalid="ignore"):
+        m = (dx * (y - ym)).sum() / (dx * dx).sum()
+    return xm, ym, m
+
+
+if njit is not None:
+    @njit(cache=True, error_model="numpy")
+    def _line_stats_nb(x, y):
+        # Same result as _line_stats_np: a sum pass and a centred pass, no temporaries
+        n = x.size
+        sx = 0.0
+        sy = 0.0
+        for i in range(n):
+            sx += x[i]
+            sy += y[i]
+        xm = sx / n
+        ym = sy / n
+        sxx = 0.0
+        sxy = 0.0
+        for i in range(n):
+            dx = x[i] - xm
+            sxx += dx * dx
+            sxy += dx * (y[i] - ym)
+        return xm, ym, sxy / sxx
+else:
+    _line_stats_nb = None
+
+
+def _line_stats(x: np.ndarray, y: np.ndarray):
+    """
+    Means and least squares slope of the points: returns (xm, ym, m).
+    Large inputs go through the Numba kernel when numba is installed.
+    """
+    if _line_stats_nb is not None and x.size >= _NUMBA_MIN_SIZE:
+        return _line_stats_nb(x, y)
+    return _line_stats_np(x, y)
+
+
+def _linreg(x: np.ndarray, y: np.ndarray):
+    """
+    Closed-form least squares line y ≈ m x + b.
+    Returns (m, b); m is nan when x has no spread.
+    """
+    xm, ym, m = _line_stats(x, y)
+    return m, ym - m * xm
+
+
 def slope_at_point(x: np.ndarray, y: np.ndarray, x0: float, window: int = 3) -> float:
     """
     Estimate slope (dy/dx) at x0 by fitting a local straight line (the least squares).
-    Picks points in a window around the nearest x to x0. Falls back gracefully.
+    Picks points in a window around the nearest x to x0. Falls back gracefully;
+    returns nan when x0 is not finite or any x is NaN.
     """
     if len(x) < 2:
         return float("nan")
+    # A NaN or infinite x0 has no nearest neighbour, and a NaN x value would poison the fit
+    if not np.isfinite(x0) or np.isnan(x).any():
+        return float("nan")
 
-    # Sort by x to compute neighbor windows robustly
-    order = np.argsort(x)
-    xs = x[order]
-    ys = y[order]
-
-    # Index of nearest x to x0
-    idx = int(np.argmin(np.abs(xs - x0)))
+    # Nearest x to x0 (the smaller one on a distance tie) and its rank in sorted order
+    d = np.abs(x - x0)
+    x_near = x[d == d.min()].min()
+    r = int(np.count_nonzero(x < x_near))
 
-    lo = max(0, idx - window)
-    hi = min(len(xs), idx + window + 1)
-    xw = xs[lo:hi]
-    yw = ys[lo:hi]
+    # Points ranked lo..hi-1 in sorted order, by partial selection (no full sort needed)
+    lo = max(0, r - window)
+    hi = min(len(x), r + window + 1)
+    idx = np.argpartition(x, (lo, hi - 1))[lo:hi]
+    xw = x[idx]
+    yw = y[idx]
 
     # If still insufficient unique x values, widen or fallback to global
-    if len(np.unique(xw)) < 2:
-        if len(np.unique(xs)) >= 2:
+    if xw.min() == xw.max():
+        if x.min() != x.max():
             # Use more points if possible
-            xw = xs
-            yw = ys
+            xw = x
+            yw = y
         else:
             return float("nan")
 
     try:
         # Linear fit: y ≈ m x + b
-        m, b = np.polyfit(xw, yw, 1)
+        m, b = _linreg(xw, yw)
         return float(m)
     except Exception:
         return float("nan")
@@ -92,40 +228,61 @@ class XYTable(ctk.CTkScrollableFrame):
         ctk.CTkLabel(self, text="y", width=80, anchor="w").grid(row=0, column=1, padx=6, pady=6, sticky="w")
 
     def add_row(self, x_val: str = "", y_val: str = ""):
-        r = len(self.rows) + 1
-        ex = ctk.CTkEntry(self, width=120)
-        ey = ctk.CTkEntry(self, width=120)
-        ex.insert(0, str(x_val))
-        ey.insert(0, str(y_val))
-        ex.grid(row=r, column=0, padx=6, pady=4, sticky="w")
-        ey.grid(row=r, column=1, padx=6, pady=4, sticky="w")
-        self.rows.append((ex, ey))
+        self.add_rows([(x_val, y_val)])
+
+    def add_rows(self, pairs):
+        base = len(self.rows) + 1
+        for i, (x_val, y_val) in enumerate(pairs):
+            # Parsed values are cached per row; any write to either entry's text marks it dirty
+            xvar = tk.StringVar(self, value=str(x_val))
+            yvar = tk.StringVar(self, value=str(y_val))
+            ex = ctk.CTkEntry(self, width=120, textvariable=xvar)
+            ey = ctk.CTkEntry(self, width=120, textvariable=yvar)
+            ex.grid(row=base + i, column=0, padx=6, pady=4, sticky="w")
+            ey.grid(row=base + i, column=1, padx=6, pady=4, sticky="w")
+            row = {"ex": ex, "ey": ey, "xv": None, "yv": None, "dirty": True}
+            # Trace callbacks are Tcl commands holding `row`; clear() must remove them or rows leak
+            row["traces"] = [
+                (var, var.trace_add("write", lambda *_args, row=row: row.update(dirty=True)))
+                for var in (xvar, yvar)
+            ]
+            self.rows.append(row)
 
     def clear(self):
-        for ex, ey in self.rows:
-            ex.destroy()
-            ey.destroy()
+        for row in self.rows:
+            for var, trace_name in row["traces"]:
+                var.trace_remove("write", trace_name)
+            row["ex"].destroy()
+            row["ey"].destroy()
         self.rows.clear()
 
-    def get_data(self):
-        xs, ys = [], []
-        for ex, ey in self.rows:
-            sx = ex.get().strip()
-            sy = ey.get().strip()
-            if sx == "" and sy == "":
-                continue
+    @staticmethod
+    def _parse_row(row):
+        sx = row["ex"].get().strip()
+        sy = row["ey"].get().strip()
+        if sx == "" and sy == "":
+            row["xv"] = row["yv"] = None
+        else:
             if sx == "" or sy == "":
                 raise ValueError("Each row must have both x and y values.")
             try:
-                xv = float(sx)
-                yv = float(sy)
+                row["xv"] = float(sx)
+                row["yv"] = float(sy)
             except ValueError:
                 raise ValueError(f"Invalid number: x='{sx}', y='{sy}'")
-            xs.append(xv)
-            ys.append(yv)
-        if len(xs) == 0:
+        row["dirty"] = False
+
+    def get_data(self):
+        for row in self.rows:
+            if row["dirty"]:
+                self._parse_row(row)
+        pairs = [(row["xv"], row["yv"]) for row in self.rows if row["xv"] is not None]
+        if len(pairs) == 0:
             raise ValueError("Please enter at least one (x, y) pair.")
-        return np.array(xs, dtype=float), np.array(ys, dtype=float)
+        n = len(pairs)
+        xs = np.fromiter((xv for xv, _ in pairs), dtype=np.float64, count=n)
+        ys = np.fromiter((yv for _, yv in pairs), dtype=np.float64, count=n)
+        return xs, ys
 
 
 class GraphApp(ctk.CTk):
@@ -137,6 +294,10 @@ class GraphApp(ctk.CTk):
         ctk.set_default_color_theme("blue")
 
         self.mode = tk.StringVar(value="Using x, y values")
+        self._rng = np.random.default_rng()
+        # (key, array) caches for equation mode; arrays are read-only so they can be shared
+        self._x_cache = None
+        self._y_cache = None
         self._build_layout()
         self._build_plot()
         self._show_mode(self.mode.get())
@@ -241,10 +402,63 @@ class GraphApp(ctk.CTk):
         self.ax.set_ylabel("y")
         self.ax.grid(True, alpha=0.3)
 
+        # Persistent artists, updated in place by _plot_points
+        self._scatter = self.ax.scatter([], [], color="#1f77b4", s=50, label="Data points")
+        self._fitline, = self.ax.plot([], [], color="#ff7f0e", linewidth=2, label="Best fit line")
+        self._curve, = self.ax.plot([], [], color="#1f77b4", linewidth=2, label="Curve")
+        self._rpts = self.ax.scatter([], [], color="#2ca02c", s=60, label="Random points")
+        self._gpt = self.ax.scatter([], [], color="#d62728", marker="X", s=90, label="G Point")
+        self._annots = [
+            self.ax.annotate("", (0, 0), textcoords="offset points", xytext=(8, 6), fontsize=8, visible=False)
+            for _ in range(2)
+        ]
+
+        # One legend per mode, built once; "best" placement is searched on full draws only
+        # and then pinned for blitted redraws (see _on_draw / _draw_dynamic)
+        self._legend_xy = Legend(
+            self.ax, [self._scatter, self._fitline, self._rpts, self._gpt],
+            ["Data points", "Best fit line", "Random points on fit", "G Point"],
+            loc="best", fontsize=9
+        )
+        self._legend_eq = Legend(
+            self.ax, [self._scatter, self._curve, self._rpts, self._gpt],
+            ["Data points", "Curve", "Random points on curve", "G Point"],
+            loc="best", fontsize=9
+        )
+        for legend in (self._legend_xy, self._legend_eq):
+            legend.set_visible(False)
+            self.ax.add_artist(legend)
+
+        # Artists that change on every draw are left out of the cached background and blitted on top
+        self._dynamic = [self._scatter, self._fitline, self._curve, self._rpts, self._gpt,
+                         *self._annots, self.ax.title, self._legend_xy, self._legend_eq]
+        for artist in self._dynamic:
+            artist.set_animated(True)
+        self._bg = None
+        self._bg_lims = None
+
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.right)
         self.canvas.get_tk_widget().grid(row=0, column=0, padx=8, pady=8, sticky="nsew")
+        self.canvas.mpl_connect("draw_event", self._on_draw)
         self.canvas.draw()
 
+    def _on_draw(self, event):
+        # A full draw happened (first show, resize, new limits): refresh the cached background
+        self._bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._bg_lims = (self.ax.get_xlim(), self.ax.get_ylim())
+        for legend in (self._legend_xy, self._legend_eq):
+            legend.set_loc("best")
+        self._draw_dynamic()
+
+    def _draw_dynamic(self):
+        for artist in self._dynamic:
+            self.fig.draw_artist(artist)
+        # Pin the drawn legend where it landed, so later blits skip the "best" search
+        for legend in (self._legend_xy, self._legend_eq):
+            if legend.get_visible():
+                bbox = legend.get_window_extent()
+                legend.set_loc(tuple(self.ax.transAxes.inverted().transform((bbox.x0, bbox.y0))))
+
     def _on_mode_change(self, mode_value: str):
         self._show_mode(mode_value)
 
@@ -259,32 +473,40 @@ class GraphApp(ctk.CTk):
     def _load_xy_sample(self):
         self.xy_table.clear()
         # Sample: y = x^2 for x in [-2,-1,0,1,2]
-        for xv in [-2, -1, 0, 1, 2]:
-            self.xy_table.add_row(str(xv), str(xv * xv))
+        pairs = [(str(xv), str(xv * xv)) for xv in [-2, -1, 0, 1, 2]]
         # Add a blank row for convenience
-        self.xy_table.add_row("", "")
+        pairs.append(("", ""))
+        self.xy_table.add_rows(pairs)
 
-    def _plot_points(self, x, y, title_info=""):
-        self.ax.clear()
-        self.ax.grid(True, alpha=0.3)
-        self.ax.set_xlabel("x")
-        self.ax.set_ylabel("y")
-
-        mask = np.isfinite(x) & np.isfinite(y)
-        x = x[mask]
-        y = y[mask]
+    def _plot_points(self, x, y, title_info="", sorted_x=False):
+        # Common case is all-finite: skip building the mask and copying
+        if not (np.isfinite(x).all() and np.isfinite(y).all()):
+            mask = np.isfinite(x) & np.isfinite(y)
+            x = x[mask]
+            y = y[mask]
 
         if len(x) == 0:
             raise ValueError("No valid finite data to plot.")
 
+        fit_line = self.mode.get() == "Using x, y values" and len(x) >= 2
+        if fit_line:
+            # G Point and least squares slope share the same reductions
+            Gx, Gy, m = _line_stats(x, y)
+        else:
+            # Equation mode only needs the G Point
+            Gx, Gy = x.mean(), y.mean()
+        Gx = float(Gx)
+        Gy = float(Gy)
+
         # Scatter original points
-        self.ax.scatter(x, y, color="#1f77b4", s=50, label="Data points")
+        self._scatter.set_offsets(np.column_stack((x, y)))
 
         # Fit model
-        if self.mode.get() == "Using x, y values" and len(x) >= 2:
+        if fit_line:
             # Try linear fit first
-            coeffs_lin = np.polyfit(x, y, deg=1)
-            y_lin = np.polyval(coeffs_lin, x)
+            b = Gy - m * Gx
+            coeffs_lin = np.array([m, b])
+            y_lin = m * x + b
             residuals = np.sum((y - y_lin) ** 2)
 
             # Try cubic fit
@@ -300,47 +522,68 @@ class GraphApp(ctk.CTk):
                 fit_degree = 3
 
             # Generate smooth line
-            x_fit = np.linspace(min(x), max(x), 300)
+            # Sorted input (the finite mask keeps order) has its range at the ends
+            if sorted_x:
+                x_fit = np.linspace(x[0], x[-1], 300)
+            else:
+                x_fit = np.linspace(x.min(), x.max(), 300)
             y_fit = np.polyval(coeffs, x_fit)
-            self.ax.plot(x_fit, y_fit, color="#ff7f0e", linewidth=2,
-                         label="Best fit line" if fit_degree == 1 else "Best fit curve")
+            self._fitline.set_data(x_fit, y_fit)
+            self._legend_xy.get_texts()[1].set_text("Best fit line" if fit_degree == 1 else "Best fit curve")
+            self._fitline.set_visible(True)
+            # Empty the hidden line too: legend placement looks at every line, visible or not
+            self._curve.set_data([], [])
+            self._curve.set_visible(False)
+            self._legend_xy.set_visible(True)
+            self._legend_eq.set_visible(False)
 
             # Pick random points ON the fitted line
-            rng = np.random.default_rng()
+            rng = self._rng
             rand_x = rng.choice(x_fit, size=2, replace=False)
             rand_y = np.polyval(coeffs, rand_x)
-            self.ax.scatter(rand_x, rand_y, color="#2ca02c", s=60, label="Random points on fit")
-            for xi, yi in zip(rand_x, rand_y):
-                self.ax.annotate(f"({xi:.3g}, {yi:.3g})", (xi, yi),
-                                 textcoords="offset points", xytext=(8, 6), fontsize=8)
-
-            # Slope from random points
-            slope_random = (rand_y[1] - rand_y[0]) / (rand_x[1] - rand_x[0])
 
         else:
             # Equation mode: already smooth
-            self.ax.plot(x, y, color="#1f77b4", linewidth=2, label="Curve")
-            rng = np.random.default_rng()
+            self._curve.set_data(x, y)
+            self._curve.set_visible(True)
+            self._fitline.set_data([], [])
+            self._fitline.set_visible(False)
+            self._legend_eq.set_visible(True)
+            self._legend_xy.set_visible(False)
+
+            rng = self._rng
             rand_idx = rng.choice(len(x), size=2, replace=False)
             rand_x, rand_y = x[rand_idx], y[rand_idx]
-            self.ax.scatter(rand_x, rand_y, color="#2ca02c", s=60, label="Random points on curve")
-            for xi, yi in zip(rand_x, rand_y):
-                self.ax.annotate(f"({xi:.3g}, {yi:.3g})", (xi, yi),
-                                 textcoords="offset points", xytext=(8, 6), fontsize=8)
-            slope_random = (rand_y[1] - rand_y[0]) / (rand_x[1] - rand_x[0])
+
+        self._rpts.set_offsets(np.column_stack((rand_x, rand_y)))
+        for ann, xi, yi in zip(self._annots, rand_x, rand_y):
+            ann.xy = (xi, yi)
+            ann.set_text(f"({xi:.3g}, {yi:.3g})")
+            ann.set_visible(True)
+
+        # Slope from random points
+        slope_random = (rand_y[1] - rand_y[0]) / (rand_x[1] - rand_x[0])
 
         # G Point
-        Gx = float(np.mean(x))
-        Gy = float(np.mean(y))
-        self.ax.scatter([Gx], [Gy], color="#d62728", marker="X", s=90, label="G Point")
+        self._gpt.set_offsets([[Gx, Gy]])
 
         subtitle = f"G=({Gx:.4g}, {Gy:.4g})   |   slope (random pts)={slope_random:.4g}"
         self.ax.set_title(title_info + ("\n" if title_info else "") + subtitle)
-        self.ax.legend(loc="best", fontsize=9)
 
         self.status.configure(text=f"G Point: ({Gx:.6g}, {Gy:.6g})    |    Slope (random pts): {slope_random:.6g}")
 
-        self.canvas.draw()
+        # Collections are not covered by relim(), so add the data points explicitly
+        self.ax.relim(visible_only=True)
+        self.ax.update_datalim(np.column_stack((x, y)))
+        self.ax.autoscale_view()
+
+        if self._bg is not None and (self.ax.get_xlim(), self.ax.get_ylim()) == self._bg_lims:
+            # Axes, ticks and grid are unchanged: repaint only the dynamic artists
+            self.canvas.restore_region(self._bg)
+            self._draw_dynamic()
+            self.canvas.blit(self.fig.bbox)
+        else:
+            self.canvas.draw_idle()
 
     def draw_chart(self):
         try:
@@ -348,11 +591,13 @@ class GraphApp(ctk.CTk):
                 x, y = self.xy_table.get_data()
                 if len(x) < 2:
                     raise ValueError("Please enter at least two points to draw a chart.")
-                # Sort by x for a sensible path
-                order = np.argsort(x)
-                x = x[order]
-                y = y[order]
-                self._plot_points(x, y, title_info="From x, y values")
+                # Sort by x for a sensible path (rows are often entered in order already);
+                # any NaN makes the check fail, so such input is always sorted
+                if not np.all(x[:-1] <= x[1:]):
+                    order = np.argsort(x)
+                    x = x[order]
+                    y = y[order]
+                self._plot_points(x, y, title_info="From x, y values", sorted_x=True)
             else:
                 expr = self.eq_entry.get().strip()
                 if expr == "":
@@ -369,11 +614,25 @@ class GraphApp(ctk.CTk):
                 if npts < 10:
                     raise ValueError("Use at least 10 points for a meaningful curve.")
 
-                x = np.linspace(xmin, xmax, npts)
-                y = safe_eval_expression(expr, x)
-                if y.shape != x.shape:
-                    raise ValueError("The expression did not evaluate to a vector of y values.")
-                self._plot_points(x, y, title_info=f"y = {expr}")
+                x_key = (xmin, xmax, npts)
+                if self._x_cache is None or self._x_cache[0] != x_key:
+                    x = np.linspace(xmin, xmax, npts)
+                    x.flags.writeable = False
+                    self._x_cache = (x_key, x)
+                x = self._x_cache[1]
+
+                y_key = (expr, x_key)
+                if self._y_cache is not None and self._y_cache[0] == y_key:
+                    y = self._y_cache[1]
+                else:
+                    y = safe_eval_expression(expr, x)
+                    if y.shape != x.shape:
+                        raise ValueError("The expression did not evaluate to a vector of y values.")
+                    # Anything reaching through np (e.g. np.random) may not be repeatable
+                    if "np" not in _expr_fn(expr).__code__.co_names:
+                        y.flags.writeable = False
+                        self._y_cache = (y_key, y)
+                self._plot_points(x, y, title_info=f"y = {expr}", sorted_x=True)
         except Exception as ex:
             messagebox.showerror("Error", str(ex))
 
@@ -381,6 +640,5 @@ class GraphApp(ctk.CTk):
 if __name__ == "__main__":
     app = GraphApp()
 
-    for _ in range(5):
-        app.xy_table.add_row("", "")
+    app.xy_table.add_rows([("", "")] * 5)
     app.mainloop()